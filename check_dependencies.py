@@ -105,8 +105,9 @@ def main():
     required_packages = {
         "numpy": "1.23.0",
         "scipy": "1.9.0",
+        "pandas": "1.4.0",
         "matplotlib": "3.6.0",
-        "streamlit": "1.13.0",
+        "streamlit": "1.55.0",
         "PIL": "9.2.0"  # Pillow
     }
     
@@ -7,7 +7,10 @@ matrix and solving the eigenvalue problem to find energy levels and wave functio
 
 import numpy as np
 from scipy import sparse
-from scipy.sparse.linalg import eigsh
+from scipy.sparse.linalg import eigsh, splu, LinearOperator
+
+# Number of eigenstates used as the expansion basis for time evolution
+EVOLUTION_BASIS_SIZE = 20
 
 
 def construct_laplacian_1d(n_points, dx, boundary_condition='dirichlet'):
@@ -36,14 +39,15 @@ def construct_laplacian_1d(n_points, dx, boundary_condition='dirichlet'):
     diagonals = [-2.0 * np.ones(n_points), np.ones(n_points-1), np.ones(n_points-1)]
     offsets = [0, 1, -1]
     
-    # Create the Laplacian matrix
-    laplacian = sparse.diags(diagonals, offsets, shape=(n_points, n_points), format='csr')
-    
     # Apply boundary conditions
     if boundary_condition.lower() == 'periodic':
-        # Connect the first and last points
-        laplacian[0, n_points-1] = 1.0
-        laplacian[n_points-1, 0] = 1.0
+        # Connect the first and last points through the corner diagonals, so
+        # the matrix is built in one pass instead of editing the CSR structure
+        diagonals += [np.ones(1), np.ones(1)]
+        offsets += [n_points-1, -(n_points-1)]
+    
+    # Create the Laplacian matrix
+    laplacian = sparse.diags(diagonals, offsets, shape=(n_points, n_points), format='csr')
     
     # Scale by -1/(dx^2) to get the correct Laplacian
     laplacian = -laplacian / (dx**2)
@@ -73,19 +77,12 @@ def construct_laplacian_2d(nx, ny, dx, dy, boundary_condition='dirichlet'):
     if boundary_condition.lower() not in ['dirichlet', 'periodic']:
         raise ValueError("boundary_condition must be 'dirichlet' or 'periodic'")
     
-    # Total number of grid points
-    n_total = nx * ny
-    
     # Create 1D Laplacians for x and y directions
     laplacian_x = construct_laplacian_1d(nx, dx, boundary_condition)
     laplacian_y = construct_laplacian_1d(ny, dy, boundary_condition)
     
-    # Create identity matrices
-    identity_x = sparse.eye(nx, format='csr')
-    identity_y = sparse.eye(ny, format='csr')
-    
-    # Construct 2D Laplacian using Kronecker products
-    laplacian_2d = sparse.kron(identity_y, laplacian_x) + sparse.kron(laplacian_y, identity_x)
+    # Construct 2D Laplacian as the Kronecker sum I_y ⊗ L_x + L_y ⊗ I_x
+    laplacian_2d = sparse.kronsum(laplacian_x, laplacian_y, format='csr')
     
     return laplacian_2d
 
@@ -122,7 +119,58 @@ def construct_hamiltonian(laplacian, potential_values, hbar=1.0, mass=1.0):
     return hamiltonian
 
 
-def solve_schrodinger(hamiltonian, n_eigenstates=6, which='SM'):
+def shift_invert_operator(hamiltonian, which='SM'):
+    """
+    Factorize the shifted Hamiltonian used by shift-invert eigenvalue searches.
+    
+    The factorization only depends on the Hamiltonian and ``which``, so it can
+    be computed once and passed to :func:`solve_schrodinger` for any number of
+    eigenstates.
+    
+    Parameters
+    ----------
+    hamiltonian : scipy.sparse.csr_matrix
+        The Hamiltonian operator matrix.
+    which : str, optional
+        Which eigenvalues will be searched for ('SM' or 'SA'). Default is 'SM'.
+        
+    Returns
+    -------
+    sigma : float
+        The shift.
+    inverse : scipy.sparse.linalg.LinearOperator or None
+        Operator applying (H - sigma*I)^-1, or None if the shifted matrix is
+        singular even after moving the shift off an eigenvalue.
+    """
+    # ARPACK converges fastest on the largest eigenvalues of (H - sigma*I)^-1,
+    # which are the eigenvalues of H closest to sigma. For 'SM' the shift is 0;
+    # for 'SA' it is a Gershgorin lower bound of the spectrum, so the closest
+    # eigenvalues are the algebraically smallest ones.
+    if which == 'SA':
+        diagonal = hamiltonian.diagonal()
+        radius = abs(hamiltonian).sum(axis=1).A1 - np.abs(diagonal)
+        sigma = np.min(diagonal - radius)
+    else:
+        sigma = 0.0
+    
+    identity = sparse.identity(hamiltonian.shape[0], dtype=hamiltonian.dtype)
+    try:
+        lu = splu((hamiltonian - sigma * identity).tocsc())
+    except RuntimeError:
+        # sigma is an eigenvalue. Move the shift just below it, which keeps the
+        # same eigenvalues closest; ARPACK's regular mode can miss an exactly
+        # zero eigenvalue, so it is only the last resort
+        scale = max(abs(hamiltonian).max(), abs(sigma))
+        sigma -= np.sqrt(np.finfo(hamiltonian.dtype).eps) * scale
+        try:
+            lu = splu((hamiltonian - sigma * identity).tocsc())
+        except RuntimeError:
+            return sigma, None
+    
+    return sigma, LinearOperator(hamiltonian.shape, matvec=lu.solve, dtype=hamiltonian.dtype)
+
+
+def solve_schrodinger(hamiltonian, n_eigenstates=6, which='SM', shift_invert=None):
     """
     Solve the time-independent Schrödinger equation to find energy eigenvalues
     and eigenfunctions.
@@ -137,6 +185,9 @@ def solve_schrodinger(hamiltonian, n_eigenstates=6, which='SM'):
         Which eigenvalues to find:
         - 'SM': Smallest eigenvalues in magnitude (default)
         - 'SA': Smallest eigenvalues algebraically
+    shift_invert : tuple, optional
+        The ``(sigma, inverse)`` pair returned by :func:`shift_invert_operator`
+        for this Hamiltonian and ``which``. Computed if not given.
         
     Returns
     -------
@@ -145,8 +196,17 @@ def solve_schrodinger(hamiltonian, n_eigenstates=6, which='SM'):
     eigenvectors : numpy.ndarray
         Array of eigenvectors (wave functions).
     """
+    if shift_invert is None:
+        shift_invert = shift_invert_operator(hamiltonian, which)
+    sigma, inverse = shift_invert
+    
     # Solve the eigenvalue problem
-    eigenvalues, eigenvectors = eigsh(hamiltonian, k=n_eigenstates, which=which)
+    if inverse is not None:
+        eigenvalues, eigenvectors = eigsh(hamiltonian, k=n_eigenstates,
+                                          sigma=sigma, which='LM', OPinv=inverse)
+    else:
+        # The shifted matrix is singular; fall back to the regular mode
+        eigenvalues, eigenvectors = eigsh(hamiltonian, k=n_eigenstates, which=which)
     
     # Sort eigenvalues and eigenvectors
     idx = np.argsort(eigenvalues)
@@ -156,7 +216,28 @@ def solve_schrodinger(hamiltonian, n_eigenstates=6, which='SM'):
     return eigenvalues, eigenvectors
 
 
-def time_evolution(initial_state, hamiltonian, time_points, hbar=1.0):
+def probability_density(psi):
+    """
+    Compute the probability density |ψ|² of a wave function.
+    
+    Parameters
+    ----------
+    psi : numpy.ndarray
+        Wave function values (real or complex).
+        
+    Returns
+    -------
+    numpy.ndarray
+        Array of probability densities with the same shape as psi.
+    """
+    # Re(ψ)² + Im(ψ)² avoids the square root np.abs would take first
+    if np.iscomplexobj(psi):
+        return psi.real**2 + psi.imag**2
+    return psi**2
+
+
+def time_evolution(initial_state, hamiltonian, time_points, hbar=1.0,
+                   eigenvalues=None, eigenvectors=None, dtype=np.complex128):
     """
     Compute the time evolution of a quantum state under a time-independent Hamiltonian.
     
@@ -170,26 +251,43 @@ def time_evolution(initial_state, hamiltonian, time_points, hbar=1.0):
         Array of time points at which to compute the wave function.
     hbar : float, optional
         Reduced Planck constant. Default is 1.0 (natural units).
+    eigenvalues, eigenvectors : numpy.ndarray, optional
+        Precomputed eigenpairs of the Hamiltonian to expand the state in. If
+        not given, the lowest ``EVOLUTION_BASIS_SIZE`` eigenstates are computed.
+    dtype : numpy.dtype, optional
+        Complex dtype of the returned states. Default is complex128; complex64
+        halves the memory and the cost of the final matrix product, which is
+        enough for display.
         
     Returns
     -------
     states : numpy.ndarray
         Array of wave functions at each time point.
     """
-    # Solve the eigenvalue problem for the Hamiltonian
-    eigenvalues, eigenvectors = solve_schrodinger(hamiltonian, n_eigenstates=min(20, hamiltonian.shape[0]))
+    dtype = np.dtype(dtype)
+    if dtype.kind != 'c':
+        raise ValueError("dtype must be a complex dtype")
+    
+    # Solve the eigenvalue problem for the Hamiltonian unless a basis is given
+    if eigenvalues is None or eigenvectors is None:
+        eigenvalues, eigenvectors = solve_schrodinger(
+            hamiltonian, n_eigenstates=min(EVOLUTION_BASIS_SIZE, hamiltonian.shape[0])
+        )
     
     # Express the initial state in the energy eigenbasis
     coefficients = np.dot(eigenvectors.T.conj(), initial_state)
     
-    # Initialize array to store states at each time point
-    states = np.zeros((len(time_points), len(initial_state)), dtype=complex)
+    # Phase factors exp(-i*E_n*t/ħ) for every (eigenstate, time) pair at once
+    phases = np.exp(np.multiply.outer(-1j * eigenvalues / hbar, time_points))
     
-    # Compute the state at each time point
-    for i, t in enumerate(time_points):
-        # Apply time evolution operator exp(-i*H*t/ħ) in the energy eigenbasis
-        time_evolved_coeffs = coefficients * np.exp(-1j * eigenvalues * t / hbar)
-        # Transform back to position basis
-        states[i] = np.dot(eigenvectors, time_evolved_coeffs)
+    # Apply the time evolution operator in the energy eigenbasis and transform
+    # back to position basis for all time points with a single matrix product,
+    # carried out in the requested precision
+    expansion = (coefficients[:, np.newaxis] * phases).astype(dtype, copy=False)
+    # Real eigenvectors (those of a real Hamiltonian) stay real, in the
+    # matching precision, so the product is a cheaper real-complex one
+    real_dtype = np.empty((), dtype).real.dtype
+    basis = eigenvectors.astype(real_dtype if np.isrealobj(eigenvectors) else dtype, copy=False)
+    states = (basis @ expansion).T
     
     return states
\ No newline at end of file
@@ -12,6 +12,7 @@ import matplotlib.pyplot as plt
 from schrodinger_solver import potentials
 from schrodinger_solver.solver_1d import Schrodinger1D
 from schrodinger_solver.solver_2d import Schrodinger2D
+from schrodinger_solver.wave_packets import create_gaussian_wave_packet, create_gaussian_wave_packet_2d
 
 
 def parse_args():
@@ -99,17 +100,6 @@ def get_potential_params(potential_name):
         return {}
 
 
-def create_gaussian_wave_packet(x_grid, center, width, k0):
-    """Create a Gaussian wave packet."""
-    return np.exp(-0.5 * ((x_grid - center) / width)**2) * np.exp(1j * k0 * x_grid)
-
-
-def create_gaussian_wave_packet_2d(x_grid, y_grid, center_x, center_y, width_x, width_y, k0_x, k0_y):
-    """Create a 2D Gaussian wave packet."""
-    return (np.exp(-0.5 * ((x_grid - center_x) / width_x)**2 - 0.5 * ((y_grid - center_y) / width_y)**2) 
-            * np.exp(1j * (k0_x * x_grid + k0_y * y_grid)))
-
-
 def solve_1d(args):
     """Solve the 1D Schrödinger equation."""
     # Get the potential function and parameters
@@ -136,11 +126,7 @@ def solve_1d(args):
         center = (args.domain_min + args.domain_max) / 2
         width = (args.domain_max - args.domain_min) / 10
         k0 = 2.0  # Initial momentum
-        initial_state = create_gaussian_wave_packet(solver.x_grid, center, width, k0)
-        
-        # Normalize the initial state
-        norm = np.sqrt(np.trapz(np.abs(initial_state)**2, x=solver.x_grid))
-        initial_state = initial_state / norm
+        initial_state = create_gaussian_wave_packet(solver.x_grid, center, width, k0, solver.dx)
         
         # Create the animation
         anim = solver.animate_time_evolution(initial_state, args.t_max, args.n_steps)
@@ -196,13 +182,10 @@ def solve_2d(args):
         k0_y = 0.0  # Initial momentum in y
         
         initial_state = create_gaussian_wave_packet_2d(
-            solver.x_grid, solver.y_grid, center_x, center_y, width_x, width_y, k0_x, k0_y
+            solver.x_axis[np.newaxis, :], solver.y_axis[:, np.newaxis], center_x, center_y, width_x, width_y, k0_x, k0_y,
+            solver.dx, solver.dy
         )
         
-        # Normalize the initial state
-        norm = np.sqrt(np.sum(np.abs(initial_state)**2) * solver.dx * solver.dy)
-        initial_state = initial_state / norm
-        
         # Create the animation
         anim = solver.animate_time_evolution(initial_state, args.t_max, args.n_steps)
         
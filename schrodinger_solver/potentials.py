@@ -31,7 +31,7 @@ def infinite_well_1d(x_grid, width=1.0, offset=0.0, depth=0.0, wall_value=1e6):
     numpy.ndarray
         Array of potential values at each grid point.
     """
-    potential = np.ones_like(x_grid) * wall_value
+    potential = np.full_like(x_grid, wall_value)
     
     # Define the well region
     well_min = offset - width/2
@@ -194,7 +194,7 @@ def infinite_well_2d(x_grid, y_grid, width_x=1.0, width_y=1.0, offset_x=0.0, off
     numpy.ndarray
         2D array of potential values at each grid point.
     """
-    potential = np.ones_like(x_grid) * wall_value
+    potential = np.full_like(x_grid, wall_value)
     
     # Define the well region
     well_x_min = offset_x - width_x/2
@@ -258,7 +258,7 @@ def circular_well_2d(x_grid, y_grid, radius=1.0, center_x=0.0, center_y=0.0, dep
     numpy.ndarray
         2D array of potential values at each grid point.
     """
-    potential = np.ones_like(x_grid) * wall_value
+    potential = np.full_like(x_grid, wall_value)
     
     # Calculate distance from center
     r_squared = (x_grid - center_x)**2 + (y_grid - center_y)**2
@@ -0,0 +1,289 @@
+"""
+Frame rendering for time-evolution animations.
+
+This module rasterizes the figures drawn by the solvers' ``plot_states`` into
+arrays of RGBA frames, splitting the frames across worker processes when more
+than one CPU is available, and encodes the frames as a video.
+"""
+
+import atexit
+import io
+import multiprocessing
+import os
+import subprocess
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import matplotlib as mpl
+import matplotlib.pyplot as plt
+from matplotlib import animation
+
+# Below this many frames per worker, starting a process costs more than it saves
+MIN_FRAMES_PER_WORKER = 25
+
+
+def render_frames(fig, update, artists, frames):
+    """
+    Rasterize frames of a figure that is updated frame by frame.
+
+    Only the parts of the figure that can change are redrawn for each frame,
+    on top of a cached background; the frames are identical to full draws.
+
+    Parameters
+    ----------
+    fig : matplotlib.figure.Figure
+        The figure to render.
+    update : callable
+        ``update(frame)`` updates the figure to show frame ``frame``.
+    artists : sequence of matplotlib.artist.Artist
+        The artists of ``fig`` that ``update`` changes.
+    frames : sequence of int
+        Indices of the frames to render.
+
+    Returns
+    -------
+    numpy.ndarray
+        Array of shape (len(frames), height, width, 4) with the RGBA frames.
+    """
+    # Render every frame straight into one preallocated RGBA buffer
+    canvas = fig.canvas
+    width, height = canvas.get_width_height(physical=True)
+    rgba_frames = np.empty((len(frames), height, width, 4), dtype=np.uint8)
+
+    # Drawing the changing artists over a full draw would paint them above the
+    # grid lines, spines and legends that should cover them, so leave
+    # everything from the lowest changing artist upwards out of the cached
+    # background and redraw it on each frame in the order a full draw uses
+    update(frames[0])
+    redrawn = []
+    for ax in dict.fromkeys(artist.axes for artist in artists):
+        redrawn += _artists_from_first(ax, artists)
+    # A full canvas draw skips animated artists. Marking them animated rather
+    # than invisible keeps the layout (such as the title position) identical
+    # to a full draw
+    animated = [artist.get_animated() for artist in redrawn]
+    for artist in redrawn:
+        artist.set_animated(True)
+    canvas.draw()
+    background = canvas.copy_from_bbox(fig.bbox)
+    for artist, was_animated in zip(redrawn, animated):
+        artist.set_animated(was_animated)
+
+    for i, frame in enumerate(frames):
+        canvas.restore_region(background)
+        update(frame)
+        for artist in redrawn:
+            if artist.get_visible():
+                fig.draw_artist(artist)
+        rgba_frames[i] = np.asarray(canvas.buffer_rgba())
+
+    return rgba_frames
+
+
+def _artists_from_first(ax, artists):
+    """Return the children of ``ax`` drawn from the first of ``artists`` on."""
+    # Same order as Axes.draw: the patch first, then a stable sort by zorder
+    children = sorted((child for child in ax.get_children() if child is not ax.patch),
+                      key=lambda child: child.zorder)
+    first = next(i for i, child in enumerate(children) if child in artists)
+    return children[first:]
+
+
+def _init_worker():
+    """Set up Matplotlib in a worker process."""
+    import matplotlib
+    matplotlib.use('Agg')
+
+    from custom_mpl_style import set_mpl_theme
+    set_mpl_theme()
+
+
+# Worker pool shared by all render_time_evolution calls, started on first use
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor():
+    """Return the shared worker pool, starting it if needed."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            # Spawn rather than fork: the caller (e.g. a Streamlit server) is
+            # multi-threaded, and forking a threaded process can deadlock
+            _executor = ProcessPoolExecutor(
+                max_workers=os.cpu_count() or 1,
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=_init_worker,
+            )
+            atexit.register(shutdown_workers)
+        return _executor
+
+
+def shutdown_workers():
+    """
+    Shut down the worker pool of ``render_time_evolution``.
+
+    The pool is started again on the next parallel render. It is also shut
+    down automatically when the interpreter exits.
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(cancel_futures=True)
+            atexit.unregister(shutdown_workers)
+            _executor = None
+
+
+def _render_states(solver, times, states, max_amplitude, plot_kwargs):
+    """Plot ``states`` and render all of their frames."""
+    fig, update, artists = solver.plot_states(times, states, max_amplitude=max_amplitude,
+                                              **plot_kwargs)
+    rgba_frames = render_frames(fig, update, artists, range(len(times)))
+    plt.close(fig)
+    return rgba_frames
+
+
+def render_time_evolution(solver, initial_state, t_max, n_steps, n_workers=None, **plot_kwargs):
+    """
+    Render all frames of a time-evolution animation.
+
+    Parameters
+    ----------
+    solver : Schrodinger1D or Schrodinger2D
+        The solver whose ``plot_states`` draws the frames.
+    initial_state : numpy.ndarray
+        Initial wave function.
+    t_max : float
+        Maximum time for evolution.
+    n_steps : int
+        Number of time steps (frames).
+    n_workers : int, optional
+        Number of worker processes. Default is the number of CPUs. Frames are
+        rendered in-process when fewer than two workers would be used.
+    **plot_kwargs : dict
+        Additional keyword arguments to pass to ``plot_states``, such as
+        ``figsize`` and ``dpi``.
+
+    Returns
+    -------
+    numpy.ndarray
+        Array of shape (n_steps, height, width, 4) with the RGBA frames.
+    """
+    if n_workers is None:
+        n_workers = os.cpu_count() or 1
+    n_workers = min(n_workers, n_steps // MIN_FRAMES_PER_WORKER)
+
+    # Evolve the state once, in single precision like animate_time_evolution,
+    # and fix the plot scale over the whole evolution
+    times, states = solver.evolve_state(initial_state, t_max, n_steps, dtype=np.complex64)
+    max_amplitude = np.max(np.abs(states))
+
+    if n_workers < 2:
+        return _render_states(solver, times, states, max_amplitude, plot_kwargs)
+
+    # Each worker rebuilds the figure and renders one contiguous block of
+    # frames from only the states in that block
+    bounds = np.linspace(0, n_steps, n_workers + 1).astype(int)
+    executor = _get_executor()
+    futures = [
+        executor.submit(_render_states, solver, times[start:stop], states[start:stop],
+                        max_amplitude, plot_kwargs)
+        for start, stop in zip(bounds[:-1], bounds[1:])
+    ]
+    return np.concatenate([future.result() for future in futures])
+
+
+def frames_to_mp4(frames, duration):
+    """
+    Encode RGBA frames as an H.264 MP4 using ffmpeg.
+
+    Parameters
+    ----------
+    frames : numpy.ndarray
+        RGBA frames of shape (n_frames, height, width, 4).
+    duration : int
+        Display time of each frame in milliseconds.
+
+    Returns
+    -------
+    bytes
+        The MP4 file.
+
+    Raises
+    ------
+    subprocess.CalledProcessError
+        If ffmpeg fails, for example when it was built without libx264.
+    """
+    n_frames, height, width, _ = frames.shape
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "animation.mp4")
+        command = [
+            mpl.rcParams["animation.ffmpeg_path"], "-y", "-loglevel", "error",
+            "-f", "rawvideo", "-pix_fmt", "rgba", "-s", f"{width}x{height}",
+            "-framerate", f"{1000 / duration:g}", "-i", "-",
+            # yuv420p (needed by most browsers) requires even dimensions
+            "-vf", "pad=ceil(iw/2)*2:ceil(ih/2)*2",
+            "-c:v", "libx264", "-pix_fmt", "yuv420p", "-movflags", "+faststart",
+            path,
+        ]
+        # Stream the raw frames to ffmpeg without copying them into bytes
+        subprocess.run(command, input=memoryview(frames.reshape(-1)), check=True)
+        with open(path, "rb") as f:
+            return f.read()
+
+
+def frames_to_gif(frames, duration):
+    """
+    Encode RGBA frames as a looping GIF.
+
+    Parameters
+    ----------
+    frames : numpy.ndarray
+        RGBA frames of shape (n_frames, height, width, 4).
+    duration : int
+        Display time of each frame in milliseconds.
+
+    Returns
+    -------
+    bytes
+        The GIF file.
+    """
+    # Only needed when there is no usable ffmpeg
+    from PIL import Image
+
+    images = [Image.fromarray(frame) for frame in frames]
+    gif_buf = io.BytesIO()
+    images[0].save(
+        gif_buf, format='GIF', save_all=True, append_images=images[1:],
+        duration=duration, loop=0
+    )
+    return gif_buf.getvalue()
+
+
+def encode_frames(frames, duration):
+    """
+    Encode RGBA frames as an MP4 if ffmpeg can, otherwise as a GIF.
+
+    Parameters
+    ----------
+    frames : numpy.ndarray
+        RGBA frames of shape (n_frames, height, width, 4).
+    duration : int
+        Display time of each frame in milliseconds.
+
+    Returns
+    -------
+    media_bytes : bytes
+        The encoded video.
+    media_format : str
+        ``'mp4'`` or ``'gif'``.
+    """
+    if animation.writers.is_available("ffmpeg"):
+        try:
+            return frames_to_mp4(frames, duration), "mp4"
+        except subprocess.CalledProcessError:
+            # An ffmpeg build without libx264 cannot encode H.264
+            pass
+    return frames_to_gif(frames, duration), "gif"
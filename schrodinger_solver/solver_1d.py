@@ -13,6 +13,8 @@ from schrodinger_solver.core import (
     construct_laplacian_1d,
     construct_hamiltonian,
     solve_schrodinger,
+    probability_density,
+    EVOLUTION_BASIS_SIZE,
     time_evolution
 )
 
@@ -68,8 +70,11 @@ class Schrodinger1D:
         # Initialize attributes for eigenvalues and eigenvectors
         self.eigenvalues = None
         self.eigenvectors = None
+        
+        # Eigenbasis used by evolve_state, computed on first use
+        self.evolution_basis = None
     
-    def solve(self, n_eigenstates=6, which='SM'):
+    def solve(self, n_eigenstates=6, which='SM', shift_invert=None):
         """
         Solve the time-independent Schrödinger equation to find energy eigenvalues
         and eigenfunctions.
@@ -82,6 +87,9 @@ class Schrodinger1D:
             Which eigenvalues to find:
             - 'SM': Smallest eigenvalues in magnitude (default)
             - 'SA': Smallest eigenvalues algebraically
+        shift_invert : tuple, optional
+            Precomputed factorization from ``shift_invert_operator`` for this
+            solver's Hamiltonian and ``which``.
             
         Returns
         -------
@@ -91,7 +99,7 @@ class Schrodinger1D:
             Array of eigenvectors (wave functions).
         """
         self.eigenvalues, self.eigenvectors = solve_schrodinger(
-            self.hamiltonian, n_eigenstates, which
+            self.hamiltonian, n_eigenstates, which, shift_invert
         )
         return self.eigenvalues, self.eigenvectors
     
@@ -118,8 +126,8 @@ class Schrodinger1D:
         # Extract the eigenfunction
         psi = self.eigenvectors[:, n]
         
-        # Normalize the eigenfunction
-        norm = np.sqrt(np.trapz(np.abs(psi)**2, x=self.x_grid))
+        # Normalize the eigenfunction (uniform grid: the integral is a sum times dx)
+        norm = np.sqrt(np.vdot(psi, psi).real * self.dx)
         psi = psi / norm
         
         return psi
@@ -139,9 +147,38 @@ class Schrodinger1D:
             The probability density |ψ|².
         """
         psi = self.get_eigenfunction(n)
-        return np.abs(psi)**2
+        return probability_density(psi)
+    
+    def get_evolution_basis(self, shift_invert=None):
+        """
+        Get the eigenbasis used to evolve states in time.
+        
+        The lowest ``EVOLUTION_BASIS_SIZE`` eigenstates are computed on the
+        first call and stored in ``evolution_basis``, since they only depend
+        on the Hamiltonian.
+        
+        Parameters
+        ----------
+        shift_invert : tuple, optional
+            Precomputed factorization from ``shift_invert_operator`` for this
+            solver's Hamiltonian and ``which='SM'``, such as the one passed to
+            :meth:`solve`. Only used on the first call; computed if not given.
+        
+        Returns
+        -------
+        eigenvalues : numpy.ndarray
+            Array of energy eigenvalues.
+        eigenvectors : numpy.ndarray
+            Array of eigenvectors.
+        """
+        if self.evolution_basis is None:
+            self.evolution_basis = solve_schrodinger(
+                self.hamiltonian, min(EVOLUTION_BASIS_SIZE, self.hamiltonian.shape[0]),
+                shift_invert=shift_invert
+            )
+        return self.evolution_basis
     
-    def evolve_state(self, initial_state, t_max, n_steps):
+    def evolve_state(self, initial_state, t_max, n_steps, dtype=np.complex128):
         """
         Evolve an initial state in time under the Hamiltonian.
         
@@ -153,6 +190,8 @@ class Schrodinger1D:
             Maximum time for evolution.
         n_steps : int
             Number of time steps.
+        dtype : numpy.dtype, optional
+            Complex dtype of the evolved states. Default is complex128.
             
         Returns
         -------
@@ -164,8 +203,10 @@ class Schrodinger1D:
         # Create time points
         times = np.linspace(0, t_max, n_steps)
         
-        # Evolve the state
-        states = time_evolution(initial_state, self.hamiltonian, times, self.hbar)
+        # Evolve the state in the (cached) energy eigenbasis
+        eigenvalues, eigenvectors = self.get_evolution_basis()
+        states = time_evolution(initial_state, self.hamiltonian, times, self.hbar,
+                               eigenvalues, eigenvectors, dtype)
         
         return times, states
     
@@ -307,7 +348,7 @@ class Schrodinger1D:
         
         return fig
     
-    def animate_time_evolution(self, initial_state, t_max, n_steps, interval=50, figsize=(10, 6)):
+    def animate_time_evolution(self, initial_state, t_max, n_steps, interval=50, figsize=(10, 6), dpi=None):
         """
         Create an animation of the time evolution of a quantum state.
         
@@ -323,19 +364,99 @@ class Schrodinger1D:
             Interval between frames in milliseconds. Default is 50.
         figsize : tuple, optional
             Figure size. Default is (10, 6).
+        dpi : float, optional
+            Resolution of the frames in dots per inch. Default is the
+            ``figure.dpi`` rcParam.
             
         Returns
         -------
         matplotlib.animation.FuncAnimation
             Animation of the time evolution.
         """
+        # Evolve the state in single precision, which is plenty for drawing
+        times, states = self.evolve_state(initial_state, t_max, n_steps, dtype=np.complex64)
+        return self.animate_states(times, states, interval, figsize, dpi)
+    
+    def animate_states(self, times, states, interval=50, figsize=(10, 6), dpi=None,
+                       max_amplitude=None):
+        """
+        Create an animation of precomputed wave functions.
+        
+        Parameters
+        ----------
+        times : numpy.ndarray
+            Time of each frame.
+        states : numpy.ndarray
+            Wave function of each frame, with shape (len(times), n_points).
+        interval : int, optional
+            Interval between frames in milliseconds. Default is 50.
+        figsize : tuple, optional
+            Figure size. Default is (10, 6).
+        dpi : float, optional
+            Resolution of the frames in dots per inch. Default is the
+            ``figure.dpi`` rcParam.
+        max_amplitude : float, optional
+            Largest |ψ| used to scale the plot. Default is the largest over
+            ``states``; pass the value for the whole evolution when ``states``
+            only holds some of its frames.
+            
+        Returns
+        -------
+        matplotlib.animation.FuncAnimation
+            Animation of the states.
+        """
         import matplotlib.animation as animation
         
-        # Evolve the state
-        times, states = self.evolve_state(initial_state, t_max, n_steps)
+        fig, update, _ = self.plot_states(times, states, figsize, dpi, max_amplitude)
+        
+        # Create the animation; with blitting only the artists returned by
+        # update are redrawn on each frame
+        anim = animation.FuncAnimation(
+            fig, update, frames=len(times), interval=interval, blit=True
+        )
+        
+        return anim
+    
+    def plot_states(self, times, states, figsize=(10, 6), dpi=None, max_amplitude=None):
+        """
+        Plot the first of a sequence of precomputed wave functions.
+        
+        This builds the figure of :meth:`animate_states` without the animation,
+        for callers that draw the frames themselves, such as
+        :func:`~schrodinger_solver.rendering.render_frames`.
+        
+        Parameters
+        ----------
+        times : numpy.ndarray
+            Time of each frame.
+        states : numpy.ndarray
+            Wave function of each frame, with shape (len(times), n_points).
+        figsize : tuple, optional
+            Figure size. Default is (10, 6).
+        dpi : float, optional
+            Resolution of the frames in dots per inch. Default is the
+            ``figure.dpi`` rcParam.
+        max_amplitude : float, optional
+            Largest |ψ| used to scale the plot. Default is the largest over
+            ``states``.
+            
+        Returns
+        -------
+        fig : matplotlib.figure.Figure
+            The figure, showing the first frame.
+        update : callable
+            ``update(frame)`` shows frame number ``frame`` and returns
+            ``artists``.
+        artists : tuple of matplotlib.artist.Artist
+            The artists that change from frame to frame.
+        """
+        # Split every frame into contiguous float32 arrays once up front
+        real_parts = np.real(states).astype(np.float32)
+        imag_parts = np.imag(states).astype(np.float32)
+        prob_densities = probability_density(states)
         
         # Create the figure and axes
-        fig, ax = plt.subplots(figsize=figsize)
+        fig, ax = plt.subplots(figsize=figsize, dpi=dpi)
         
         # Plot the potential
         ax.plot(self.x_grid, self.potential_values, 'k--', label='Potential')
@@ -351,7 +472,8 @@ class Schrodinger1D:
         ax.set_title('Time Evolution of Quantum State')
         
         # Set the y-limits based on the maximum amplitude
-        max_amplitude = np.max(np.abs(states))
+        if max_amplitude is None:
+            max_amplitude = np.max(np.abs(states))
         ax.set_ylim(-1.5 * max_amplitude, 1.5 * max_amplitude)
         ax.set_xlim(self.x_min, self.x_max)
         
@@ -361,24 +483,20 @@ class Schrodinger1D:
         # Add legend
         ax.legend()
         
-        # Define the update function for the animation
+        artists = (line_real, line_imag, line_prob, time_text)
+        
+        # Define the update function for the frames
         def update(frame):
-            # Update the wave function
-            psi = states[frame]
-            
             # Update the lines
-            line_real.set_data(self.x_grid, np.real(psi))
-            line_imag.set_data(self.x_grid, np.imag(psi))
-            line_prob.set_data(self.x_grid, np.abs(psi)**2)
+            line_real.set_data(self.x_grid, real_parts[frame])
+            line_imag.set_data(self.x_grid, imag_parts[frame])
+            line_prob.set_data(self.x_grid, prob_densities[frame])
             
             # Update the time text
             time_text.set_text(f'Time: {times[frame]:.2f}')
             
-            return line_real, line_imag, line_prob, time_text
+            return artists
         
-        # Create the animation
-        anim = animation.FuncAnimation(
-            fig, update, frames=n_steps, interval=interval, blit=True
-        )
+        update(0)
         
-        return anim
\ No newline at end of file
+        return fig, update, artists
\ No newline at end of file
@@ -8,13 +8,13 @@ building on the core functions and potential implementations.
 import numpy as np
 from scipy import sparse
 import matplotlib.pyplot as plt
-from matplotlib import cm
-from mpl_toolkits.mplot3d import Axes3D
 
 from schrodinger_solver.core import (
     construct_laplacian_2d,
     construct_hamiltonian,
     solve_schrodinger,
+    probability_density,
+    EVOLUTION_BASIS_SIZE,
     time_evolution
 )
 
@@ -25,7 +25,8 @@ class Schrodinger2D:
     """
     
     def __init__(self, x_min, x_max, y_min, y_max, nx, ny, potential_func, 
-                 hbar=1.0, mass=1.0, boundary='dirichlet', **potential_params):
+                 hbar=1.0, mass=1.0, boundary='dirichlet', dtype=np.float64,
+                 **potential_params):
         """
         Initialize the 2D Schrödinger equation solver.
         
@@ -45,6 +46,10 @@ class Schrodinger2D:
             Particle mass. Default is 1.0 (natural units).
         boundary : str, optional
             Boundary condition ('dirichlet' or 'periodic'). Default is 'dirichlet'.
+        dtype : numpy.dtype, optional
+            Floating-point dtype of the Hamiltonian and hence of the eigenvectors.
+            Default is float64; float32 halves the memory traffic of the
+            eigensolve, which is ample for visualization.
         **potential_params : dict
             Additional parameters to pass to the potential function.
         """
@@ -61,27 +66,34 @@ class Schrodinger2D:
         self.dx = (x_max - x_min) / (nx - 1)
         self.dy = (y_max - y_min) / (ny - 1)
         
-        x = np.linspace(x_min, x_max, nx)
-        y = np.linspace(y_min, y_max, ny)
-        self.x_grid, self.y_grid = np.meshgrid(x, y)
+        # 1D coordinate axes; x_axis[np.newaxis, :] and y_axis[:, np.newaxis]
+        # broadcast to the (ny, nx) grid without materializing it
+        self.x_axis = np.linspace(x_min, x_max, nx)
+        self.y_axis = np.linspace(y_min, y_max, ny)
+        self.x_grid, self.y_grid = np.meshgrid(self.x_axis, self.y_axis)
         
         # Compute the potential values
         self.potential_values = potential_func(self.x_grid, self.y_grid, **potential_params)
         
-        # Flatten the potential values for the Hamiltonian construction
-        self.potential_flat = self.potential_values.flatten()
+        # Flatten the potential values (as a view) for the Hamiltonian construction
+        self.potential_flat = self.potential_values.ravel()
         
         # Construct the Laplacian operator
         self.laplacian = construct_laplacian_2d(nx, ny, self.dx, self.dy, boundary)
         
         # Construct the Hamiltonian
-        self.hamiltonian = construct_hamiltonian(self.laplacian, self.potential_flat, hbar, mass)
+        self.hamiltonian = construct_hamiltonian(
+            self.laplacian, self.potential_flat, hbar, mass
+        ).astype(dtype, copy=False)
         
         # Initialize attributes for eigenvalues and eigenvectors
         self.eigenvalues = None
         self.eigenvectors = None
+        
+        # Eigenbasis used by evolve_state, computed on first use
+        self.evolution_basis = None
     
-    def solve(self, n_eigenstates=6, which='SM'):
+    def solve(self, n_eigenstates=6, which='SM', shift_invert=None):
         """
         Solve the time-independent Schrödinger equation to find energy eigenvalues
         and eigenfunctions.
@@ -94,6 +106,9 @@ class Schrodinger2D:
             Which eigenvalues to find:
             - 'SM': Smallest eigenvalues in magnitude (default)
             - 'SA': Smallest eigenvalues algebraically
+        shift_invert : tuple, optional
+            Precomputed factorization from ``shift_invert_operator`` for this
+            solver's Hamiltonian and ``which``.
             
         Returns
         -------
@@ -103,7 +118,7 @@ class Schrodinger2D:
             Array of eigenvectors (wave functions).
         """
         self.eigenvalues, self.eigenvectors = solve_schrodinger(
-            self.hamiltonian, n_eigenstates, which
+            self.hamiltonian, n_eigenstates, which, shift_invert
         )
         return self.eigenvalues, self.eigenvectors
     
@@ -134,7 +149,7 @@ class Schrodinger2D:
         psi_2d = psi_flat.reshape(self.ny, self.nx)
         
         # Normalize the eigenfunction
-        norm = np.sqrt(np.sum(np.abs(psi_2d)**2) * self.dx * self.dy)
+        norm = np.sqrt(np.vdot(psi_2d, psi_2d).real * self.dx * self.dy)
         psi_2d = psi_2d / norm
         
         return psi_2d
@@ -154,9 +169,38 @@ class Schrodinger2D:
             The probability density |ψ|² reshaped to 2D.
         """
         psi_2d = self.get_eigenfunction(n)
-        return np.abs(psi_2d)**2
+        return probability_density(psi_2d)
     
-    def evolve_state(self, initial_state_2d, t_max, n_steps):
+    def get_evolution_basis(self, shift_invert=None):
+        """
+        Get the eigenbasis used to evolve states in time.
+        
+        The lowest ``EVOLUTION_BASIS_SIZE`` eigenstates are computed on the
+        first call and stored in ``evolution_basis``, since they only depend
+        on the Hamiltonian.
+        
+        Parameters
+        ----------
+        shift_invert : tuple, optional
+            Precomputed factorization from ``shift_invert_operator`` for this
+            solver's Hamiltonian and ``which='SM'``, such as the one passed to
+            :meth:`solve`. Only used on the first call; computed if not given.
+        
+        Returns
+        -------
+        eigenvalues : numpy.ndarray
+            Array of energy eigenvalues.
+        eigenvectors : numpy.ndarray
+            Array of eigenvectors.
+        """
+        if self.evolution_basis is None:
+            self.evolution_basis = solve_schrodinger(
+                self.hamiltonian, min(EVOLUTION_BASIS_SIZE, self.hamiltonian.shape[0]),
+                shift_invert=shift_invert
+            )
+        return self.evolution_basis
+    
+    def evolve_state(self, initial_state_2d, t_max, n_steps, dtype=np.complex128):
         """
         Evolve an initial state in time under the Hamiltonian.
         
@@ -168,6 +212,8 @@ class Schrodinger2D:
             Maximum time for evolution.
         n_steps : int
             Number of time steps.
+        dtype : numpy.dtype, optional
+            Complex dtype of the evolved states. Default is complex128.
             
         Returns
         -------
@@ -182,13 +228,13 @@ class Schrodinger2D:
         # Create time points
         times = np.linspace(0, t_max, n_steps)
         
-        # Evolve the state
-        states_flat = time_evolution(initial_state_flat, self.hamiltonian, times, self.hbar)
+        # Evolve the state in the (cached) energy eigenbasis
+        eigenvalues, eigenvectors = self.get_evolution_basis()
+        states_flat = time_evolution(initial_state_flat, self.hamiltonian, times, self.hbar,
+                                     eigenvalues, eigenvectors, dtype)
         
         # Reshape the states to 2D
-        states_2d = np.zeros((n_steps, self.ny, self.nx), dtype=complex)
-        for i in range(n_steps):
-            states_2d[i] = states_flat[i].reshape(self.ny, self.nx)
+        states_2d = states_flat.reshape(n_steps, self.ny, self.nx)
         
         return times, states_2d
     
@@ -243,7 +289,7 @@ class Schrodinger2D:
         cmap : str, optional
             Colormap to use. Default is 'quantum_diverging' for better visualization of negative values.
         plot_type : str, optional
-            Type of plot ('surface', 'contour', or 'contourf'). Default is 'surface'.
+            Type of plot ('surface', 'contour', 'contourf', or 'image'). Default is 'surface'.
         **plot_kwargs : dict
             Additional keyword arguments to pass to the plot function.
             
@@ -290,8 +336,15 @@ class Schrodinger2D:
                                   cmap=cmap, **plot_kwargs)
             cbar = plt.colorbar(contourf, ax=ax)
             cbar.ax.yaxis.set_major_formatter(FuncFormatter(format_negative_values))
+        elif plot_type == 'image':
+            # The grid is uniform, so a raster image avoids contouring entirely
+            image = ax.imshow(np.real(psi_2d), origin='lower', 
+                              extent=[self.x_min, self.x_max, self.y_min, self.y_max],
+                              aspect='auto', interpolation='nearest', cmap=cmap, **plot_kwargs)
+            cbar = plt.colorbar(image, ax=ax)
+            cbar.ax.yaxis.set_major_formatter(FuncFormatter(format_negative_values))
         else:
-            raise ValueError("plot_type must be 'surface', 'contour', or 'contourf'")
+            raise ValueError("plot_type must be 'surface', 'contour', 'contourf', or 'image'")
         
         # Make negative labels in colorbar bold
         for label in cbar.ax.get_yticklabels():
@@ -319,7 +372,7 @@ class Schrodinger2D:
         cmap : str, optional
             Colormap to use. Default is 'viridis'.
         plot_type : str, optional
-            Type of plot ('surface', 'contour', or 'contourf'). Default is 'contourf'.
+            Type of plot ('surface', 'contour', 'contourf', or 'image'). Default is 'contourf'.
         **plot_kwargs : dict
             Additional keyword arguments to pass to the plot function.
             
@@ -364,8 +417,13 @@ class Schrodinger2D:
             contourf = ax.contourf(self.x_grid, self.y_grid, prob_density, 
                                   cmap=cmap, **plot_kwargs)
             cbar = plt.colorbar(contourf, ax=ax)
+        elif plot_type == 'image':
+            image = ax.imshow(prob_density, origin='lower', 
+                              extent=[self.x_min, self.x_max, self.y_min, self.y_max],
+                              aspect='auto', interpolation='nearest', cmap=cmap, **plot_kwargs)
+            cbar = plt.colorbar(image, ax=ax)
         else:
-            raise ValueError("plot_type must be 'surface', 'contour', or 'contourf'")
+            raise ValueError("plot_type must be 'surface', 'contour', 'contourf', or 'image'")
         
         ax.set_xlabel('X')
         ax.set_ylabel('Y')
@@ -386,7 +444,7 @@ class Schrodinger2D:
         cmap : str, optional
             Colormap to use. Default is 'quantum_diverging' for better visualization of negative values.
         plot_type : str, optional
-            Type of plot ('contour' or 'contourf'). Default is 'contourf'.
+            Type of plot ('contour', 'contourf', or 'image'). Default is 'contourf'.
             
         Returns
         -------
@@ -419,8 +477,8 @@ class Schrodinger2D:
                 ax = axes[i]
             
             # Plot the eigenstate
-            if plot_type == 'contour':
-                self.plot_eigenfunction(i, ax=ax, cmap=cmap, plot_type='contour')
+            if plot_type in ('contour', 'image'):
+                self.plot_eigenfunction(i, ax=ax, cmap=cmap, plot_type=plot_type)
             else:
                 self.plot_eigenfunction(i, ax=ax, cmap=cmap, plot_type='contourf')
         
@@ -433,7 +491,8 @@ class Schrodinger2D:
         plt.tight_layout()
         return fig
     
-    def animate_time_evolution(self, initial_state_2d, t_max, n_steps, interval=50, figsize=(10, 8), cmap='viridis'):
+    def animate_time_evolution(self, initial_state_2d, t_max, n_steps, interval=50, figsize=(10, 8), cmap='viridis',
+                               dpi=None):
         """
         Create an animation of the time evolution of a quantum state.
         
@@ -451,27 +510,116 @@ class Schrodinger2D:
             Figure size. Default is (10, 8).
         cmap : str, optional
             Colormap to use. Default is 'viridis'.
+        dpi : float, optional
+            Resolution of the frames in dots per inch. Default is the
+            ``figure.dpi`` rcParam.
             
         Returns
         -------
         matplotlib.animation.FuncAnimation
             Animation of the time evolution.
         """
+        # Evolve the state in single precision, which is plenty for a
+        # colormapped image
+        times, states_2d = self.evolve_state(initial_state_2d, t_max, n_steps, dtype=np.complex64)
+        return self.animate_states(times, states_2d, interval, figsize, cmap, dpi)
+    
+    def animate_states(self, times, states_2d, interval=50, figsize=(10, 8), cmap='viridis',
+                       dpi=None, max_amplitude=None):
+        """
+        Create an animation of precomputed wave functions.
+        
+        Parameters
+        ----------
+        times : numpy.ndarray
+            Time of each frame.
+        states_2d : numpy.ndarray
+            Wave function of each frame, with shape (len(times), ny, nx).
+        interval : int, optional
+            Interval between frames in milliseconds. Default is 50.
+        figsize : tuple, optional
+            Figure size. Default is (10, 8).
+        cmap : str, optional
+            Colormap to use. Default is 'viridis'.
+        dpi : float, optional
+            Resolution of the frames in dots per inch. Default is the
+            ``figure.dpi`` rcParam.
+        max_amplitude : float, optional
+            Largest |ψ| used to scale the colours. Default is the largest over
+            ``states_2d``; pass the value for the whole evolution when
+            ``states_2d`` only holds some of its frames.
+            
+        Returns
+        -------
+        matplotlib.animation.FuncAnimation
+            Animation of the states.
+        """
         import matplotlib.animation as animation
+        
+        fig, update, _ = self.plot_states(times, states_2d, figsize, cmap, dpi, max_amplitude)
+        
+        # Create the animation; with blitting only the image and the time
+        # label are redrawn on each frame
+        anim = animation.FuncAnimation(
+            fig, update, frames=len(times), interval=interval, blit=True
+        )
+        
+        return anim
+    
+    def plot_states(self, times, states_2d, figsize=(10, 8), cmap='viridis', dpi=None,
+                    max_amplitude=None):
+        """
+        Plot the first of a sequence of precomputed wave functions.
+        
+        This builds the figure of :meth:`animate_states` without the animation,
+        for callers that draw the frames themselves, such as
+        :func:`~schrodinger_solver.rendering.render_frames`.
+        
+        Parameters
+        ----------
+        times : numpy.ndarray
+            Time of each frame.
+        states_2d : numpy.ndarray
+            Wave function of each frame, with shape (len(times), ny, nx).
+        figsize : tuple, optional
+            Figure size. Default is (10, 8).
+        cmap : str, optional
+            Colormap to use. Default is 'viridis'.
+        dpi : float, optional
+            Resolution of the frames in dots per inch. Default is the
+            ``figure.dpi`` rcParam.
+        max_amplitude : float, optional
+            Largest |ψ| used to scale the colours. Default is the largest over
+            ``states_2d``.
+            
+        Returns
+        -------
+        fig : matplotlib.figure.Figure
+            The figure, showing the first frame.
+        update : callable
+            ``update(frame)`` shows frame number ``frame`` and returns
+            ``artists``.
+        artists : tuple of matplotlib.artist.Artist
+            The artists that change from frame to frame.
+        """
         from custom_mpl_style import format_negative_values, FuncFormatter
         
-        # Evolve the state
-        times, states_2d = self.evolve_state(initial_state_2d, t_max, n_steps)
+        # Compute every frame's density once up front
+        prob_densities = probability_density(states_2d)
         
         # Create the figure and axes
-        fig, axes = plt.subplots(1, 2, figsize=figsize)
-        
-        # Plot the potential on the first axis
-        contourf_pot = axes[0].contourf(self.x_grid, self.y_grid, self.potential_values, cmap='quantum_diverging')
+        fig, axes = plt.subplots(1, 2, figsize=figsize, dpi=dpi)
+        
+        # Plot the potential on the first axis as a raster image of the uniform
+        # grid, which is cheaper to draw than filled contours and matches the
+        # probability density panel. It is static, so blitting draws it once.
+        extent = [self.x_min, self.x_max, self.y_min, self.y_max]
+        image_pot = axes[0].imshow(self.potential_values, origin='lower', extent=extent,
+                                   aspect='auto', interpolation='bilinear', cmap='quantum_diverging')
         axes[0].set_xlabel('X')
         axes[0].set_ylabel('Y')
         axes[0].set_title('Potential')
-        cbar_pot = plt.colorbar(contourf_pot, ax=axes[0])
+        cbar_pot = plt.colorbar(image_pot, ax=axes[0])
         
         # Apply special formatting for negative values in the potential colorbar
         cbar_pot.ax.yaxis.set_major_formatter(FuncFormatter(format_negative_values))
@@ -481,40 +629,46 @@ class Schrodinger2D:
             if '−' in label.get_text():  # Unicode minus sign
                 label.set_fontweight('bold')
         
-        # Initialize the probability density plot on the second axis
-        prob_density = np.abs(initial_state_2d)**2
-        contourf_prob = axes[1].contourf(self.x_grid, self.y_grid, prob_density, cmap=cmap)
+        # Initialize the probability density plot on the second axis. A single
+        # image artist is created once and only its data is replaced per frame.
+        # The colour scale is fixed to the largest density over the whole run,
+        # since blitted frames do not redraw the colorbar.
+        if max_amplitude is None:
+            max_amplitude = np.max(np.abs(states_2d))
+        vmax = max_amplitude**2
+        image_prob = axes[1].imshow(prob_densities[0], origin='lower', extent=extent,
+                                    aspect='auto', cmap=cmap, vmin=0.0, vmax=vmax,
+                                    interpolation='bilinear')
         axes[1].set_xlabel('X')
         axes[1].set_ylabel('Y')
         axes[1].set_title('Probability Density')
-        plt.colorbar(contourf_prob, ax=axes[1])
+        plt.colorbar(image_prob, ax=axes[1])
+        
+        # When every grid cell spans at least two pixels, bilinear smoothing
+        # doubles the cost of each frame; nearest just enlarges the cells.
+        # The colorbar shrinks the axes, so measure them only once the layout
+        # is final
+        if fig.get_layout_engine() is not None:
+            fig.draw_without_rendering()
+        bbox = axes[1].get_window_extent()
+        if 2 * self.nx <= bbox.width and 2 * self.ny <= bbox.height:
+            image_prob.set_interpolation('nearest')
         
         # Add a text annotation for the time
         time_text = axes[1].text(0.02, 0.95, '', transform=axes[1].transAxes)
         
-        # Define the update function for the animation
+        artists = (image_prob, time_text)
+        
+        # Define the update function for the frames
         def update(frame):
-            # Clear the second axis
-            axes[1].clear()
-            
             # Update the probability density
-            psi = states_2d[frame]
-            prob_density = np.abs(psi)**2
-            
-            # Plot the new probability density
-            contourf_prob = axes[1].contourf(self.x_grid, self.y_grid, prob_density, cmap=cmap)
-            axes[1].set_xlabel('X')
-            axes[1].set_ylabel('Y')
-            axes[1].set_title('Probability Density')
+            image_prob.set_data(prob_densities[frame])
             
             # Update the time text
-            time_text = axes[1].text(0.02, 0.95, f'Time: {times[frame]:.2f}', transform=axes[1].transAxes)
+            time_text.set_text(f'Time: {times[frame]:.2f}')
             
-            return contourf_prob, time_text
+            return artists
         
-        # Create the animation
-        anim = animation.FuncAnimation(
-            fig, update, frames=n_steps, interval=interval, blit=False
-        )
+        update(0)
         
-        return anim
\ No newline at end of file
+        return fig, update, artists
\ No newline at end of file
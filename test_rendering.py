@@ -0,0 +1,158 @@
+"""
+Test script to verify that exported animation frames match full redraws.
+"""
+
+import matplotlib
+matplotlib.use('Agg')
+
+import io
+import runpy
+from pathlib import Path
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+from matplotlib import animation
+from PIL import Image
+from custom_mpl_style import set_mpl_theme
+from schrodinger_solver import potentials
+from schrodinger_solver.solver_1d import Schrodinger1D
+from schrodinger_solver.solver_2d import Schrodinger2D
+from schrodinger_solver.wave_packets import create_gaussian_wave_packet, create_gaussian_wave_packet_2d
+from schrodinger_solver.rendering import (
+    encode_frames,
+    frames_to_gif,
+    frames_to_mp4,
+    render_frames,
+    render_time_evolution,
+    shutdown_workers,
+)
+
+FRAMES = [0, 4, 9]
+
+
+def wave_packet_1d(solver):
+    """Create a normalized moving Gaussian packet on a 1D solver grid."""
+    return create_gaussian_wave_packet(solver.x_grid, 1.0, 1.0, 2.0, solver.dx)
+
+
+def wave_packet_2d(solver):
+    """Create a normalized moving Gaussian packet on a 2D solver grid."""
+    return create_gaussian_wave_packet_2d(solver.x_axis[np.newaxis, :], solver.y_axis[:, np.newaxis],
+                                          1.0, 0.0, 1.0, 1.0, 2.0, 0.0, solver.dx, solver.dy)
+
+
+def redraw_frames(fig, update, frames):
+    """Render frames with a full canvas draw, the reference for blitting."""
+    rgba_frames = []
+    for frame in frames:
+        update(frame)
+        fig.canvas.draw()
+        rgba_frames.append(np.array(fig.canvas.buffer_rgba()))
+    return np.array(rgba_frames)
+
+
+def test_blitted_frames_match_full_redraw():
+    """Test that blitted frames are identical to full redraws of the same frames."""
+    set_mpl_theme()
+
+    solver_1d = Schrodinger1D(-5, 5, 200, potentials.harmonic_oscillator_1d)
+    solver_2d = Schrodinger2D(-5, 5, -5, 5, 40, 40, potentials.harmonic_oscillator_2d)
+    cases = [
+        (solver_1d, wave_packet_1d(solver_1d), (6, 4)),
+        (solver_2d, wave_packet_2d(solver_2d), (8, 4)),
+    ]
+
+    for solver, initial_state, figsize in cases:
+        times, states = solver.evolve_state(initial_state, 2.0, 10, dtype=np.complex64)
+        fig, update, artists = solver.plot_states(times, states, figsize=figsize, dpi=50)
+        blitted = render_frames(fig, update, artists, FRAMES)
+        redrawn = redraw_frames(fig, update, FRAMES)
+        plt.close(fig)
+        assert blitted.shape == redrawn.shape
+        assert np.array_equal(blitted, redrawn)
+
+
+def test_density_interpolation_uses_final_axes_size():
+    """Test that cells are only drawn unsmoothed when they span two pixels."""
+    set_mpl_theme()
+
+    solver = Schrodinger2D(-5, 5, -5, 5, 200, 200, potentials.harmonic_oscillator_2d)
+    times = np.linspace(0, 1, 2)
+    states = np.ones((2, 200, 200), dtype=np.complex64)
+    # At 12x8 inches and 100 dpi the density axes are over 400 px wide until
+    # the colorbar takes its share, leaving under 2 px per cell
+    for dpi, interpolation in [(100, 'bilinear'), (200, 'nearest')]:
+        fig, _, _ = solver.plot_states(times, states, figsize=(12, 8), dpi=dpi)
+        assert fig.axes[1].images[0].get_interpolation() == interpolation
+        plt.close(fig)
+
+
+def test_parallel_rendering_matches_serial():
+    """Test that frames rendered by worker processes match in-process rendering."""
+    set_mpl_theme()
+
+    solver = Schrodinger2D(-5, 5, -5, 5, 40, 40, potentials.harmonic_oscillator_2d)
+    initial_state = wave_packet_2d(solver)
+    kwargs = {"figsize": (4, 2), "dpi": 50}
+
+    serial = render_time_evolution(solver, initial_state, 2.0, 50, n_workers=1, **kwargs)
+    parallel = render_time_evolution(solver, initial_state, 2.0, 50, n_workers=2, **kwargs)
+    shutdown_workers()
+    assert serial.shape[0] == 50
+    assert np.array_equal(serial, parallel)
+
+
+def random_frames(n_frames=4, height=31, width=45):
+    """Create RGBA frames with odd dimensions, as rendered figures can have."""
+    rng = np.random.default_rng(0)
+    return rng.integers(0, 256, (n_frames, height, width, 4), dtype=np.uint8)
+
+
+def test_gif_encoding_loops_all_frames():
+    """Test that the GIF holds every frame, with its duration, on a loop."""
+    gif = Image.open(io.BytesIO(frames_to_gif(random_frames(), 60)))
+    assert gif.n_frames == 4
+    assert gif.size == (45, 31)
+    assert gif.info["duration"] == 60
+    assert gif.info["loop"] == 0
+
+
+@pytest.mark.skipif(not animation.writers.is_available("ffmpeg"), reason="ffmpeg is not installed")
+def test_mp4_encoding():
+    """Test that ffmpeg encodes frames with odd dimensions as an MP4."""
+    mp4 = frames_to_mp4(random_frames(), 60)
+    assert mp4[4:8] == b"ftyp"
+    assert encode_frames(random_frames(), 60) == (mp4, "mp4")
+
+
+def test_failed_mp4_encoding_falls_back_to_gif():
+    """Test that frames are encoded as a GIF when ffmpeg fails."""
+    frames = random_frames()
+    # An executable that always fails, like an ffmpeg build without libx264
+    with matplotlib.rc_context({"animation.ffmpeg_path": "false"}):
+        media_bytes, media_format = encode_frames(frames, 60)
+    assert media_format == "gif"
+    assert media_bytes == frames_to_gif(frames, 60)
+
+
+def test_render_workers_do_not_run_the_app():
+    """Test that importing the app the way spawned workers do builds no page."""
+    app = Path(__file__).parent / "streamlit_app.py"
+    namespace = runpy.run_path(str(app), run_name="__mp_main__")
+    # Only the page body defines the translation table t
+    assert "t" not in namespace
+
+
+if __name__ == "__main__":
+    test_blitted_frames_match_full_redraw()
+    print("Blitted frames match full redraws.")
+    test_density_interpolation_uses_final_axes_size()
+    print("Density interpolation matches the final axes size.")
+    test_parallel_rendering_matches_serial()
+    print("Parallel rendering matches serial rendering.")
+    test_gif_encoding_loops_all_frames()
+    test_failed_mp4_encoding_falls_back_to_gif()
+    print("Frames are encoded as a looping GIF when ffmpeg cannot be used.")
+    test_render_workers_do_not_run_the_app()
+    print("Render workers do not run the app.")
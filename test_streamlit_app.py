@@ -69,8 +69,8 @@ if st.button("Click Me!"):
 # Add a progress bar
 st.subheader("Progress Bar")
 progress_bar = st.progress(0)
-for i in range(100):
-    # Update progress bar
-    progress_bar.progress(i + 1)
+for i in range(10, 101, 10):
+    # Update progress bar in steps of 10% to keep the number of messages small
+    progress_bar.progress(i)
 
 st.success("If you can see all the elements above, Streamlit is working correctly!")
\ No newline at end of file
@@ -0,0 +1,52 @@
+"""
+Test script to verify that Gaussian wave packets are normalized on their grids.
+"""
+
+import numpy as np
+from schrodinger_solver.wave_packets import create_gaussian_wave_packet, create_gaussian_wave_packet_2d
+
+X_AXIS = np.linspace(-5, 5, 120)
+Y_AXIS = np.linspace(-4, 4, 90)
+DX = X_AXIS[1] - X_AXIS[0]
+DY = Y_AXIS[1] - Y_AXIS[0]
+PACKET_2D = (0.3, -0.2, 0.7, 0.5, 2.0, 1.0)
+
+
+def full_grid_reference():
+    """Normalize the 2D packet over the full grid, the reference result."""
+    x_grid, y_grid = np.meshgrid(X_AXIS, Y_AXIS)
+    center_x, center_y, width_x, width_y, k0_x, k0_y = PACKET_2D
+    psi = np.exp(-0.5 * ((x_grid - center_x) / width_x)**2 - 0.5 * ((y_grid - center_y) / width_y)**2
+                 + 1j * (k0_x * x_grid + k0_y * y_grid))
+    return psi / np.sqrt(np.sum(np.abs(psi)**2) * DX * DY)
+
+
+def test_wave_packet_1d_is_normalized():
+    """Test the 1D packet norm, with the spacing given and computed."""
+    psi = create_gaussian_wave_packet(X_AXIS, 4.0, 0.8, 2.0, DX)
+    assert np.isclose(np.sum(np.abs(psi)**2) * DX, 1.0)
+    assert np.allclose(create_gaussian_wave_packet(X_AXIS, 4.0, 0.8, 2.0), psi)
+
+
+def test_wave_packet_2d_matches_full_grid_normalization():
+    """Test the separable 2D packet against a full-grid normalization."""
+    reference = full_grid_reference()
+
+    # Broadcastable axes, with the spacings given and computed
+    psi = create_gaussian_wave_packet_2d(X_AXIS[np.newaxis, :], Y_AXIS[:, np.newaxis],
+                                         *PACKET_2D, DX, DY)
+    assert psi.shape == reference.shape
+    assert np.allclose(psi, reference)
+    assert np.allclose(create_gaussian_wave_packet_2d(X_AXIS[np.newaxis, :], Y_AXIS[:, np.newaxis],
+                                                      *PACKET_2D), reference)
+
+    # Full meshgrid arrays
+    x_grid, y_grid = np.meshgrid(X_AXIS, Y_AXIS)
+    assert np.allclose(create_gaussian_wave_packet_2d(x_grid, y_grid, *PACKET_2D, DX, DY), reference)
+    assert np.allclose(create_gaussian_wave_packet_2d(x_grid, y_grid, *PACKET_2D), reference)
+
+
+if __name__ == "__main__":
+    test_wave_packet_1d_is_normalized()
+    test_wave_packet_2d_matches_full_grid_normalization()
+    print("Wave packets are normalized.")